@@ -8,8 +8,11 @@ from typing import Callable
 import uuid
 from dataclasses import dataclass, field
 import logging
+import numpy as np
 import unyt as u
 
+from src.projection import FleetProjection
+
 logger = logging.getLogger(__name__)
 
 
@@ -138,7 +141,7 @@ class FactoryUnitInventory:
     The FactoryUnitInventory class represents the inventory of a unit. It is a collection of InvventoryItems and has
     functions to add items, look up each inventory item and check for its existence, calculate the unit's productivity,
     calculate the unit's entire cost, and return the active items at a given date.
-    It can further return the expected replacement date for an inventory item.
+    It can further return the expected replacement date for an inventory item and a FleetProjection of its items.
     """
 
     unit_name: str
@@ -181,6 +184,46 @@ class FactoryUnitInventory:
             )
         return total_cost
 
+    def all_items(self) -> list[InventoryItem]:
+        """
+        Returns every inventory item of the unit, including all items reachable through the input_connections.
+        Items which are connected to several others are only returned once.
+        """
+        all_items = []
+        seen = set()
+        stack = list(reversed(self.inventory_output_items))
+        while stack:
+            inventory_item = stack.pop()
+            if id(inventory_item) in seen:
+                continue
+            seen.add(id(inventory_item))
+            all_items.append(inventory_item)
+            stack.extend(reversed(inventory_item.input_connections))
+        return all_items
+
+    def get_projection(self, use_expected_deprecation_time: bool = False) -> FleetProjection:
+        """
+        Returns a FleetProjection of all items of the unit inventory, which calculates depreciation, replacement
+        capex, cash flows and NPV for the whole fleet at once.
+        """
+        return FleetProjection.from_items(
+            self.all_items(), use_expected_deprecation_time=use_expected_deprecation_time
+        )
+
+    def expected_replacement_date(
+            self, inventory_item: InventoryItem, date: dt.date = None, use_expected_deprecation_time: bool = False
+    ) -> dt.date | None:
+        """
+        Returns the next replacement date of an inventory item on or after the given date. None is returned if the
+        item reaches its end of operation before.
+        """
+        replacement_date = FleetProjection.from_items(
+            [inventory_item], use_expected_deprecation_time=use_expected_deprecation_time
+        ).next_replacement_dates(date)[0]
+        if np.isnat(replacement_date):
+            return None
+        return replacement_date.astype(dt.date)
+
     def active_items(self, date: dt.date = None) -> list[InventoryItem]:
         """
         Returns the active items of the unit inventory at a given date.
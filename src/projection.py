@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import datetime as dt
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from src.inventory import InventoryItem
+
+
+def _to_days(date: dt.date) -> np.int64:
+    return np.datetime64(date, "D").astype(np.int64)
+
+
+def _purchase_count(
+        until: np.ndarray, start: np.ndarray, lifetime: np.ndarray
+) -> np.ndarray:
+    """
+    Number of purchases k >= 0 at start + k * lifetime that happen strictly before until.
+    """
+    return np.maximum(-((start - until) // lifetime), 0)
+
+
+@dataclass
+class FleetProjection:
+    """
+    The FleetProjection class holds a fleet of inventory items as flat NumPy arrays and projects their
+    depreciation, investments, replacements and net present value over a grid of yearly periods.
+    Every item is renewed at the same price after each lifetime until its end of operation (if any).
+    All dates are stored as days since the epoch, open-ended items end at dt.date.max.
+    """
+
+    price_per_unit: np.ndarray
+    date_of_investment: np.ndarray
+    deprecation_days: np.ndarray
+    end_of_operation: np.ndarray
+
+    def __post_init__(self):
+        self.price_per_unit = np.asarray(self.price_per_unit, dtype=np.float64)
+        self.date_of_investment = np.asarray(self.date_of_investment, dtype=np.int64)
+        self.deprecation_days = np.asarray(self.deprecation_days, dtype=np.int64)
+        self.end_of_operation = np.asarray(self.end_of_operation, dtype=np.int64)
+        if np.any(self.deprecation_days <= 0):
+            raise ValueError("The deprecation time of every inventory item must be at least one day.")
+
+    @classmethod
+    def from_items(
+            cls, inventory_items: Iterable[InventoryItem], use_expected_deprecation_time: bool = False
+    ) -> FleetProjection:
+        """
+        Builds the projection from InventoryItems. By default, the renewal cycle is the item's
+        actual_deprecation_time, otherwise the expected_deprecation_time of its inventory_type.
+        """
+        inventory_items = list(inventory_items)
+        if use_expected_deprecation_time:
+            deprecation_times = [x.inventory_type.expected_deprecation_time for x in inventory_items]
+        else:
+            deprecation_times = [x.actual_deprecation_time for x in inventory_items]
+        no_end = _to_days(dt.date.max)
+        return cls(
+            price_per_unit=[x.price_per_unit for x in inventory_items],
+            date_of_investment=[_to_days(x.date_of_investment) for x in inventory_items],
+            deprecation_days=[x.days for x in deprecation_times],
+            end_of_operation=[
+                no_end if x.end_of_operation is None else _to_days(x.end_of_operation)
+                for x in inventory_items
+            ],
+        )
+
+    def __len__(self):
+        return len(self.price_per_unit)
+
+    @staticmethod
+    def period_edges(start_date: dt.date, years: int) -> np.ndarray:
+        """
+        Returns the years + 1 edges of the yearly period grid starting at start_date as days since the epoch.
+        """
+        start = np.datetime64(start_date, "D")
+        months = start.astype("datetime64[M]") + 12 * np.arange(years + 1)
+        day_offset = start - start.astype("datetime64[M]")
+        return (months.astype("datetime64[D]") + day_offset).astype(np.int64)
+
+    def depreciation(self, start_date: dt.date, years: int) -> np.ndarray:
+        """
+        Straight-line depreciation of each item per yearly period, shape (items, years).
+        Consecutive renewal cycles cover each other without gaps, so an item depreciates by
+        price_per_unit / deprecation_days for every day it is in operation.
+        """
+        edges = self.period_edges(start_date, years)
+        begin = np.maximum(edges[:-1], self.date_of_investment[:, None])
+        end = np.minimum(edges[1:], self.end_of_operation[:, None])
+        days_in_operation = np.maximum(end - begin, 0)
+        return days_in_operation * (self.price_per_unit / self.deprecation_days)[:, None]
+
+    def _purchases(self, start_date: dt.date, years: int) -> np.ndarray:
+        edges = self.period_edges(start_date, years)
+        until = np.minimum(edges[None, :], self.end_of_operation[:, None])
+        count = _purchase_count(until, self.date_of_investment[:, None], self.deprecation_days[:, None])
+        return np.diff(count, axis=1)
+
+    def _initial_purchases(self, start_date: dt.date, years: int) -> np.ndarray:
+        edges = self.period_edges(start_date, years)
+        return (
+                (edges[:-1] <= self.date_of_investment[:, None])
+                & (self.date_of_investment[:, None] < edges[1:])
+                & (self.date_of_investment < self.end_of_operation)[:, None]
+        )
+
+    def investment(self, start_date: dt.date, years: int) -> np.ndarray:
+        """
+        Initial investment of each item per yearly period, shape (items, years).
+        """
+        return self._initial_purchases(start_date, years) * self.price_per_unit[:, None]
+
+    def replacement_capex(self, start_date: dt.date, years: int) -> np.ndarray:
+        """
+        Capital expenditure for replacing deprecated items per yearly period, shape (items, years).
+        The initial investment is not included, see investment().
+        """
+        replacements = self._purchases(start_date, years) - self._initial_purchases(start_date, years)
+        return replacements * self.price_per_unit[:, None]
+
+    def cash_flow(self, start_date: dt.date, years: int) -> np.ndarray:
+        """
+        Total expenditure of the fleet per yearly period (investments and replacements), shape (years,).
+        """
+        return (self._purchases(start_date, years) * self.price_per_unit[:, None]).sum(axis=0)
+
+    def npv(self, rate: float, start_date: dt.date, years: int) -> float:
+        """
+        Net present value of the fleet's expenditures at start_date. The cash flow of each period is
+        discounted from the beginning of the period, i.e. the first period is not discounted.
+        """
+        discount = (1.0 + rate) ** -np.arange(years, dtype=np.float64)
+        return float(self.cash_flow(start_date, years) @ discount)
+
+    def next_replacement_dates(self, date: dt.date = None) -> np.ndarray:
+        """
+        Returns the next replacement date on or after the given date for each item.
+        Items whose next replacement falls on or after their end of operation get NaT.
+        """
+        if date is None:
+            date = dt.date.today()
+        cycles = np.maximum(
+            _purchase_count(_to_days(date), self.date_of_investment, self.deprecation_days), 1
+        )
+        replacement = self.date_of_investment + cycles * self.deprecation_days
+        dates = replacement.astype("datetime64[D]")
+        dates[replacement >= self.end_of_operation] = np.datetime64("NaT")
+        return dates
+
+    def replacement_schedule(
+            self, start_date: dt.date, end_date: dt.date
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns all replacements within [start_date, end_date) as flat arrays of item indices,
+        replacement dates and replacement costs, sorted by date.
+        """
+        until = np.minimum(_to_days(end_date), self.end_of_operation)
+        first = np.maximum(
+            _purchase_count(_to_days(start_date), self.date_of_investment, self.deprecation_days), 1
+        )
+        last = _purchase_count(until, self.date_of_investment, self.deprecation_days)
+        counts = np.maximum(last - first, 0)
+
+        item_indices = np.repeat(np.arange(len(self)), counts)
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        cycles = np.repeat(first, counts) + offsets
+        replacement = self.date_of_investment[item_indices] + cycles * self.deprecation_days[item_indices]
+
+        order = np.argsort(replacement, kind="stable")
+        return (
+            item_indices[order],
+            replacement[order].astype("datetime64[D]"),
+            self.price_per_unit[item_indices[order]],
+        )
@@ -0,0 +1,123 @@
+"""
+classes and methods to test the classes specified in projection.py
+"""
+import datetime as dt
+
+import numpy as np
+import pytest
+
+from src.inventory import InventoryType, InventoryItem, FactoryUnitInventory
+from src.projection import FleetProjection
+
+
+class TestFleetProjection:
+    solar_panel = InventoryType(
+        type_name="solar_panel",
+        expected_deprecation_time=dt.timedelta(days=365 * 5),
+    )
+    battery = InventoryType(
+        type_name="battery",
+        expected_deprecation_time=dt.timedelta(days=365 * 2),
+    )
+
+    solar_panel_1 = InventoryItem(
+        inventory_type=solar_panel,
+        type_name=solar_panel.type_name,
+        price_per_unit=365.0,
+        actual_deprecation_time=dt.timedelta(days=365),
+        date_of_investment=dt.date(2021, 1, 1),
+    )
+    battery_1 = InventoryItem(
+        inventory_type=battery,
+        type_name=battery.type_name,
+        price_per_unit=730.0,
+        actual_deprecation_time=dt.timedelta(days=730),
+        date_of_investment=dt.date(2021, 1, 1),
+        end_of_operation=dt.date(2024, 1, 1),
+        input_connections=[solar_panel_1],
+    )
+    factory = FactoryUnitInventory(
+        unit_name="factory",
+        inventory_output_items=[battery_1, solar_panel_1],
+    )
+    projection = factory.get_projection()
+
+    def test_all_items(self):
+        assert self.factory.all_items() == [self.battery_1, self.solar_panel_1]
+
+    def test_depreciation(self):
+        depreciation = self.projection.depreciation(dt.date(2021, 1, 1), 4)
+        # One unit per day of operation; the battery stops on 2024-01-01.
+        np.testing.assert_allclose(depreciation[0], [365.0, 365.0, 365.0, 0.0])
+        np.testing.assert_allclose(depreciation[1], [365.0, 365.0, 365.0, 366.0])
+
+    def test_capex(self):
+        investment = self.projection.investment(dt.date(2021, 1, 1), 4)
+        replacement_capex = self.projection.replacement_capex(dt.date(2021, 1, 1), 4)
+        np.testing.assert_allclose(investment[:, 0], [730.0, 365.0])
+        np.testing.assert_allclose(investment[:, 1:], 0.0)
+        np.testing.assert_allclose(replacement_capex[0], [0.0, 0.0, 730.0, 0.0])
+        # The 2024 leap day shifts the 365-day cycle, so two panels are bought within the last period.
+        np.testing.assert_allclose(replacement_capex[1], [0.0, 365.0, 365.0, 730.0])
+        np.testing.assert_allclose(
+            self.projection.cash_flow(dt.date(2021, 1, 1), 4),
+            (investment + replacement_capex).sum(axis=0),
+        )
+
+    @pytest.mark.parametrize("rate", [0.0, 0.05])
+    def test_npv(self, rate):
+        cash_flow = self.projection.cash_flow(dt.date(2021, 1, 1), 30)
+        expected = sum(value / (1.0 + rate) ** year for year, value in enumerate(cash_flow))
+        assert self.projection.npv(rate, dt.date(2021, 1, 1), 30) == pytest.approx(expected)
+
+    def test_next_replacement_dates(self):
+        dates = self.projection.next_replacement_dates(dt.date(2023, 1, 1))
+        assert dates[0] == np.datetime64("2023-01-01")
+        assert dates[1] == np.datetime64("2023-01-01")
+        dates = self.projection.next_replacement_dates(dt.date(2023, 1, 2))
+        assert np.isnat(dates[0])
+        assert dates[1] == np.datetime64("2024-01-01")
+
+    def test_expected_replacement_date(self):
+        assert self.factory.expected_replacement_date(
+            self.solar_panel_1, dt.date(2020, 6, 1)
+        ) == dt.date(2022, 1, 1)
+        assert self.factory.expected_replacement_date(
+            self.solar_panel_1, dt.date(2020, 6, 1), use_expected_deprecation_time=True
+        ) == dt.date(2025, 12, 31)
+        assert self.factory.expected_replacement_date(self.battery_1, dt.date(2024, 1, 1)) is None
+
+    def test_replacement_schedule(self):
+        item_indices, dates, costs = self.projection.replacement_schedule(
+            dt.date(2021, 1, 1), dt.date(2024, 1, 1)
+        )
+        np.testing.assert_array_equal(item_indices, [1, 0, 1])
+        np.testing.assert_array_equal(
+            dates, np.array(["2022-01-01", "2023-01-01", "2023-01-01"], dtype="datetime64[D]")
+        )
+        np.testing.assert_allclose(costs, [365.0, 730.0, 365.0])
+
+    def test_schedule_matches_capex(self):
+        rng = np.random.default_rng(0)
+        projection = FleetProjection(
+            price_per_unit=rng.uniform(10.0, 1000.0, 1000),
+            date_of_investment=rng.integers(15000, 20000, 1000),
+            deprecation_days=rng.integers(30, 3650, 1000),
+            end_of_operation=rng.integers(18000, 30000, 1000),
+        )
+        edges = FleetProjection.period_edges(dt.date(2020, 1, 1), 30)
+        _, dates, costs = projection.replacement_schedule(dt.date(2020, 1, 1), dt.date(2050, 1, 1))
+        periods = np.searchsorted(edges, dates.astype(np.int64), side="right") - 1
+        np.testing.assert_allclose(
+            np.bincount(periods, weights=costs, minlength=30),
+            projection.replacement_capex(dt.date(2020, 1, 1), 30).sum(axis=0),
+        )
+
+    def test_invalid_deprecation_time(self):
+        with pytest.raises(ValueError):
+            FleetProjection(
+                price_per_unit=[1.0],
+                date_of_investment=[0],
+                deprecation_days=[0],
+                end_of_operation=[1],
+            )